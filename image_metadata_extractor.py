@@ -1,190 +1,150 @@
 import logging
-from PIL import Image
-import exifread
+from PIL import Image  # type: ignore
+import exifread  # type: ignore
+import io
 import os
-from fractions import Fraction
+import struct
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from copy import copy
+from dataclasses import dataclass, field, fields
+from functools import lru_cache, partial
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, Literal, Optional, Tuple, Type, Union, overload
 
 # Suppress debug logs from exifread
-logging.basicConfig(level=logging.WARNING)
+logging.getLogger('exifread').setLevel(logging.WARNING)
 
-def extract_clean_image_info(file_path):
-    if not os.path.isfile(file_path):
-        raise FileNotFoundError(f"The file {file_path} does not exist.")
-    
-    info = {}
+# Shared placeholder for missing values, so every result reuses one object
+_NA = sys.intern('N/A')
+
+# exifread's tag dict, and a (field name, exifread tag name, formatter) spec
+Tags = Dict[str, Any]
+FieldSpec = Tuple[str, Optional[str], Callable[[Any], Optional[str]]]
+
+def _label(label: str) -> Any:
+    # Optional result field, reported under the given label by to_dict()
+    return field(default=None, metadata={'label': label})
+
+class _Section:
+    __slots__ = ()
     
-    with Image.open(file_path) as img:
-        info['Image Properties'] = {
-            'Format': img.format,
-            'Size': f"{img.size[0]} x {img.size[1]} pixels",
-            'Color Mode': img.mode,
-            'File Size': os.path.getsize(file_path),  # Size in bytes
-            'DPI': img.info.get('dpi', 'N/A'),
-            'Duration': img.info.get('duration', 'N/A')
-        }
+    def to_dict(self) -> Dict[str, Any]:
+        # Fields left out of sparse results are None and are skipped
+        return {f.metadata['label']: value for f in fields(self)  # type: ignore[arg-type]
+                if (value := getattr(self, f.name)) is not None}
+
+@dataclass(slots=True)
+class ImageProps(_Section):
+    format: Optional[str] = _label('Format')
+    size: Optional[str] = _label('Size')
+    color_mode: Optional[str] = _label('Color Mode')
+    file_size: Optional[int] = _label('File Size')  # Size in bytes
+    dpi: Any = _label('DPI')
+    duration: Any = _label('Duration')
+
+@dataclass(slots=True)
+class CameraInfo(_Section):
+    make: Optional[str] = _label('Make')
+    model: Optional[str] = _label('Model')
+    software: Optional[str] = _label('Software')
+    lens_model: Optional[str] = _label('Lens Model')
+    camera_serial_number: Optional[str] = _label('Camera Serial Number')
+    date_of_manufacture: Optional[str] = _label('Date of Manufacture')
+
+@dataclass(slots=True)
+class DateTimeInfo(_Section):
+    taken: Optional[str] = _label('Taken')
+    digitized: Optional[str] = _label('Digitized')
+    date_time: Optional[str] = _label('DateTime')
+    time_zone_offset: Optional[str] = _label('Time Zone Offset')
+
+@dataclass(slots=True)
+class CameraSettings(_Section):
+    exposure_time: Optional[str] = _label('Exposure Time')
+    f_number: Optional[str] = _label('F-Number')
+    iso_speed: Optional[str] = _label('ISO Speed')
+    focal_length: Optional[str] = _label('Focal Length')
+    focal_length_35mm: Optional[str] = _label('Focal Length (35mm equivalent)')
+    exposure_mode: Optional[str] = _label('Exposure Mode')
+    white_balance: Optional[str] = _label('White Balance')
+    flash: Optional[str] = _label('Flash')
+    metering_mode: Optional[str] = _label('Metering Mode')
+    exposure_program: Optional[str] = _label('Exposure Program')
+    brightness_value: Optional[str] = _label('Brightness Value')
+    exposure_bias: Optional[str] = _label('Exposure Bias')
+    max_aperture_value: Optional[str] = _label('Max Aperture Value')
+    digital_zoom_ratio: Optional[str] = _label('Digital Zoom Ratio')
+    scene_capture_type: Optional[str] = _label('Scene Capture Type')
+    shutter_speed_value: Optional[str] = _label('Shutter Speed Value')
+    aperture_value: Optional[str] = _label('Aperture Value')
+    color_space: Optional[str] = _label('Color Space')
+    focus_mode: Optional[str] = _label('Focus Mode')
+    shooting_mode: Optional[str] = _label('Shooting Mode')
+    noise_reduction: Optional[str] = _label('Noise Reduction')
+    subject_area: Optional[str] = _label('Subject Area')
+
+@dataclass(slots=True)
+class GPSInfo(_Section):
+    latitude: Optional[str] = _label('Latitude')
+    longitude: Optional[str] = _label('Longitude')
+    google_maps_link: Optional[str] = _label('Google Maps Link')
+    altitude: Optional[str] = _label('Altitude')
+
+@dataclass(slots=True)
+class OtherDetails(_Section):
+    orientation: Optional[str] = _label('Orientation')
+    ycbcr_positioning: Optional[str] = _label('YCbCr Positioning')
+    resolution: Optional[str] = _label('Resolution')
+    unique_image_id: Optional[str] = _label('Unique Image ID')
+    exif_version: Optional[str] = _label('Exif Version')
+    compression: Optional[str] = _label('Compression')
+    image_width: Optional[str] = _label('Image Width')
+    image_length: Optional[str] = _label('Image Length')
+    subject_distance: Optional[str] = _label('Subject Distance')
+    metering_mode: Optional[str] = _label('Metering Mode')
+    file_name: Optional[str] = _label('File Name')
+    file_path: Optional[str] = _label('File Path')
+
+@dataclass(slots=True)
+class ImageInfo:
+    properties: ImageProps
+    camera: CameraInfo
+    date_time: DateTimeInfo
+    settings: CameraSettings
+    gps: GPSInfo
+    other: OtherDetails
     
-    with open(file_path, 'rb') as img_file:
-        tags = exifread.process_file(img_file)
-        
-        info['Camera Information'] = {
-            'Make': str(tags.get('Image Make', 'N/A')),
-            'Model': str(tags.get('Image Model', 'N/A')),
-            'Software': str(tags.get('Image Software', 'N/A')),
-            'Lens Model': str(tags.get('EXIF LensModel', 'N/A')),
-            'Camera Serial Number': str(tags.get('EXIF CameraSerialNumber', 'N/A')),
-            'Date of Manufacture': str(tags.get('EXIF DateTimeOriginal', 'N/A'))
-        }
-        
-        info['Date and Time'] = {
-            'Taken': str(tags.get('EXIF DateTimeOriginal', 'N/A')),
-            'Digitized': str(tags.get('EXIF DateTimeDigitized', 'N/A')),
-            'DateTime': str(tags.get('EXIF DateTime', 'N/A')),
-            'Time Zone Offset': str(tags.get('EXIF OffsetTimeOriginal', 'N/A'))
-        }
-        
-        info['Camera Settings'] = {
-            'Exposure Time': _fraction_to_readable(tags.get('EXIF ExposureTime'), 'N/A'),
-            'F-Number': _fraction_to_readable(tags.get('EXIF FNumber'), 'N/A'),
-            'ISO Speed': str(tags.get('EXIF ISOSpeedRatings', 'N/A')),
-            'Focal Length': _fraction_to_readable(tags.get('EXIF FocalLength'), 'N/A ') + 'mm',
-            'Focal Length (35mm equivalent)': str(tags.get('EXIF FocalLengthIn35mmFilm', 'N/A ')) + 'mm',
-            'Exposure Mode': _get_exposure_mode(tags),
-            'White Balance': _get_white_balance(tags),
-            'Flash': _get_flash_info(tags),
-            'Metering Mode': _get_metering_mode(tags),
-            'Exposure Program': _get_exposure_program(tags),
-            'Brightness Value': _fraction_to_readable(tags.get('EXIF BrightnessValue'), 'N/A'),
-            'Exposure Bias': _fraction_to_readable(tags.get('EXIF ExposureBiasValue'), 'N/A'),
-            'Max Aperture Value': _fraction_to_readable(tags.get('EXIF MaxApertureValue'), 'N/A'),
-            'Digital Zoom Ratio': _fraction_to_readable(tags.get('EXIF DigitalZoomRatio'), 'N/A'),
-            'Scene Capture Type': _get_scene_capture_type(tags),
-            'Shutter Speed Value': _fraction_to_readable(tags.get('EXIF ShutterSpeedValue'), 'N/A'),
-            'Aperture Value': _fraction_to_readable(tags.get('EXIF ApertureValue'), 'N/A'),
-            'Color Space': _get_color_space(tags),
-            'Focus Mode': _get_focus_mode(tags),
-            'Shooting Mode': _get_shooting_mode(tags),
-            'Noise Reduction': _get_noise_reduction(tags),
-            'Subject Area': _get_subject_area(tags)
-        }
-        
-        info['GPS Information'] = _extract_gps_info(tags)
-        
-        info['Other Details'] = {
-            'Orientation': _get_orientation(tags),
-            'YCbCr Positioning': _get_ycbcr_positioning(tags),
-            'Resolution': _get_resolution(tags),
-            'Unique Image ID': str(tags.get('EXIF ImageUniqueID', 'N/A')),
-            'Exif Version': str(tags.get('EXIF ExifVersion', 'N/A')),
-            'Compression': str(tags.get('EXIF Compression', 'N/A')),
-            'Image Width': str(tags.get('EXIF ExifImageWidth', 'N/A')),
-            'Image Length': str(tags.get('EXIF ExifImageLength', 'N/A')),
-            'Subject Distance': _fraction_to_readable(tags.get('EXIF SubjectDistance'), 'N/A'),
-            'Metering Mode': _get_metering_mode(tags),
-            'File Name': os.path.basename(file_path),
-            'File Path': file_path
+    def to_dict(self) -> Dict[str, Any]:
+        # The nested dict layout returned before ImageInfo existed, where GPS
+        # only listed the values found and was 'N/A' as a whole without any
+        gps = self.gps.to_dict()
+        gps_found = {label: value for label, value in gps.items() if value != _NA}
+        return {
+            'Image Properties': self.properties.to_dict(),
+            'Camera Information': self.camera.to_dict(),
+            'Date and Time': self.date_time.to_dict(),
+            'Camera Settings': self.settings.to_dict(),
+            'GPS Information': gps_found if gps_found or not gps else _NA,
+            'Other Details': self.other.to_dict()
         }
     
-    return info
-
-def _fraction_to_readable(fraction, default_value='Unknown'):
-    if not fraction:
-        return default_value
-    if isinstance(fraction.values[0], Fraction):
-        return str(fraction.values[0])
-    return f"{fraction.values[0]}/{fraction.values[1]}"
-
-def _get_exposure_mode(tags):
-    modes = {0: 'Auto', 1: 'Manual', 2: 'Auto bracket'}
-    exposure_mode_tag = tags.get('EXIF ExposureMode')
-    if exposure_mode_tag:
-        return modes.get(exposure_mode_tag.values[0], 'Unknown')
-    else:
-        return 'N/A'
-
-def _get_white_balance(tags):
-    modes = {0: 'Auto', 1: 'Manual'}
-    white_balance_tag = tags.get('EXIF WhiteBalance')
-    if white_balance_tag:
-        return modes.get(white_balance_tag.values[0], 'Unknown')
-    else:
-        return 'N/A'
-
-def _get_flash_info(tags):
-    flash_info = tags.get('EXIF Flash', None)
-    if flash_info is not None:
-        flash_value = flash_info.values[0]
-        if flash_value == 0:
-            return 'Flash did not fire'
-        elif flash_value == 1:
-            return 'Flash fired'
-        else:
-            return 'Unknown'
-    else:
-        return 'N/A'
-
-def _extract_gps_info(tags):
-    def _convert_to_degrees(value):
-        d = float(value.values[0].num) / float(value.values[0].den)
-        m = float(value.values[1].num) / float(value.values[1].den)
-        s = float(value.values[2].num) / float(value.values[2].den)
-        return d + (m / 60.0) + (s / 3600.0)
-
-    lat = tags.get('GPS GPSLatitude')
-    lat_ref = tags.get('GPS GPSLatitudeRef')
-    lon = tags.get('GPS GPSLongitude')
-    lon_ref = tags.get('GPS GPSLongitudeRef')
-    alt = tags.get('GPS GPSAltitude')
-    
-    gps_info = {}
-    if lat and lat_ref and lon and lon_ref:
-        latitude = _convert_to_degrees(lat)
-        longitude = _convert_to_degrees(lon)
-        
-        # Adjust for hemisphere
-        if lat_ref.values[0] == 'S':
-            latitude *= -1
-        if lon_ref.values[0] == 'W':
-            longitude *= -1
-        
-        gps_info['Latitude'] = f"{latitude:.5f}° {'S' if lat_ref.values[0] == 'S' else 'N'}"
-        gps_info['Longitude'] = f"{longitude:.5f}° {'W' if lon_ref.values[0] == 'W' else 'E'}"
-        # Create Google Maps link
-        gps_info['Google Maps Link'] = f"https://www.google.com/maps?q={latitude},{longitude}"
-    
-    if alt:
-        gps_info['Altitude'] = f"{float(alt.values[0].num) / float(alt.values[0].den):.2f} meters"
-    
-    return gps_info if gps_info else 'N/A'
+    def copy(self) -> 'ImageInfo':
+        # Copies each section, so changes to the copy never reach the original
+        return ImageInfo(copy(self.properties), copy(self.camera), copy(self.date_time),
+                         copy(self.settings), copy(self.gps), copy(self.other))
 
-def _get_orientation(tags):
-    orientations = {
-        1: "Normal",
-        2: "Mirrored horizontally",
-        3: "Rotated 180 degrees",
-        4: "Mirrored vertically",
-        5: "Mirrored horizontally and rotated 270 degrees CW",
-        6: "Rotated 90 degrees CW",
-        7: "Mirrored horizontally and rotated 90 degrees CW",
-        8: "Rotated 270 degrees CW"
-    }
-    orientation_tag = tags.get('Image Orientation')
-    if isinstance(orientation_tag, exifread.classes.IfdTag):
-        orientation = orientation_tag.values[0]
-        return orientations.get(orientation, 'N/A')
-    else:
-        return 'N/A'
-
-def _get_color_space(tags):
-    color_spaces = {1: 'sRGB', 2: 'Adobe RGB'}
-    color_space_tag = tags.get('EXIF ColorSpace')
-    if isinstance(color_space_tag, exifread.classes.IfdTag):
-        color_space = color_space_tag.values[0]
-        return color_spaces.get(color_space, 'N/A')
-    else:
-        return 'N/A'
-
-def _get_metering_mode(tags):
-    modes = {
+# Formats whose EXIF Pillow does not pull out at open time, but exifread
+# can still find by reading the file itself
+_FILE_EXIF_FORMATS = frozenset({'TIFF', 'HEIF'})
+
+# Enumerated EXIF tags: label -> (exifread tag name, value table, fallback
+# for values missing from the table)
+_ENUMS: Dict[str, Tuple[str, Dict[int, str], str]] = {
+    'Exposure Mode': ('EXIF ExposureMode', {0: 'Auto', 1: 'Manual', 2: 'Auto bracket'}, 'Unknown'),
+    'White Balance': ('EXIF WhiteBalance', {0: 'Auto', 1: 'Manual'}, 'Unknown'),
+    'Flash': ('EXIF Flash', {0: 'Flash did not fire', 1: 'Flash fired'}, 'Unknown'),
+    'Metering Mode': ('EXIF MeteringMode', {
         0: 'Unknown',
         1: 'Average',
         2: 'Center-weighted average',
@@ -192,15 +152,8 @@ def _get_metering_mode(tags):
         4: 'Multi-spot',
         5: 'Pattern',
         6: 'Partial'
-    }
-    metering_mode_tag = tags.get('EXIF MeteringMode')
-    if metering_mode_tag:
-        return modes.get(metering_mode_tag.values[0], 'Unknown')
-    else:
-        return 'N/A'
-
-def _get_exposure_program(tags):
-    programs = {
+    }, 'Unknown'),
+    'Exposure Program': ('EXIF ExposureProgram', {
         0: 'Not defined',
         1: 'Manual',
         2: 'Normal program',
@@ -210,86 +163,296 @@ def _get_exposure_program(tags):
         6: 'Action program',
         7: 'Portrait mode',
         8: 'Landscape mode'
-    }
-    exposure_program_tag = tags.get('EXIF ExposureProgram')
-    if exposure_program_tag:
-        return programs.get(exposure_program_tag.values[0], 'Unknown')
-    else:
-        return 'N/A'
-
-def _get_scene_capture_type(tags):
-    types = {
+    }, 'Unknown'),
+    'Scene Capture Type': ('EXIF SceneCaptureType', {
         0: 'Standard',
         1: 'Landscape',
         2: 'Portrait',
         3: 'Night scene'
-    }
-    scene_capture_type_tag = tags.get('EXIF SceneCaptureType')
-    if scene_capture_type_tag:
-        return types.get(scene_capture_type_tag.values[0], 'Unknown')
-    else:
-        return 'N/A'
-
-def _get_resolution(tags):
-    x_resolution = _fraction_to_readable(tags.get('Image XResolution'), 'N/A')
-    y_resolution = _fraction_to_readable(tags.get('Image YResolution'), 'N/A')
-    resolution_unit = _get_resolution_unit(tags)
-    return f"{x_resolution} x {y_resolution} {resolution_unit}"
-
-def _get_resolution_unit(tags):
-    units = {
+    }, 'Unknown'),
+    'Color Space': ('EXIF ColorSpace', {1: 'sRGB', 2: 'Adobe RGB'}, _NA),
+    'Focus Mode': ('EXIF FocusMode', {0: 'Manual', 1: 'Auto'}, 'Unknown'),
+    'Shooting Mode': ('EXIF ShootingMode', {0: 'Normal', 1: 'Portrait', 2: 'Landscape'}, 'Unknown'),
+    'Noise Reduction': ('EXIF NoiseReduction', {1: 'On'}, 'Off'),
+    'Orientation': ('Image Orientation', {
+        1: "Normal",
+        2: "Mirrored horizontally",
+        3: "Rotated 180 degrees",
+        4: "Mirrored vertically",
+        5: "Mirrored horizontally and rotated 270 degrees CW",
+        6: "Rotated 90 degrees CW",
+        7: "Mirrored horizontally and rotated 90 degrees CW",
+        8: "Rotated 270 degrees CW"
+    }, _NA),
+    'YCbCr Positioning': ('Image YCbCrPositioning', {1: 'Centered', 2: 'Co-sited'}, 'Unknown'),
+    'Resolution Unit': ('Image ResolutionUnit', {
         1: 'No absolute unit of measurement',
         2: 'Inches',
         3: 'Centimeters'
-    }
-    resolution_unit_tag = tags.get('Image ResolutionUnit')
-    if resolution_unit_tag:
-        return units.get(resolution_unit_tag.values[0], 'Unknown')
-    else:
-        return 'N/A'
-
-def _get_ycbcr_positioning(tags):
-    positions = {
-        1: 'Centered',
-        2: 'Co-sited'
-    }
-    ycbcr_positioning_tag = tags.get('Image YCbCrPositioning')
-    if ycbcr_positioning_tag:
-        return positions.get(ycbcr_positioning_tag.values[0], 'Unknown')
-    else:
-        return 'N/A'
-
-def _get_focus_mode(tags):
-    focus_modes = {0: 'Manual', 1: 'Auto'}
-    focus_mode_tag = tags.get('EXIF FocusMode')
-    if focus_mode_tag:
-        return focus_modes.get(focus_mode_tag.values[0], 'Unknown')
-    else:
-        return 'N/A'
-
-def _get_shooting_mode(tags):
-    shooting_modes = {0: 'Normal', 1: 'Portrait', 2: 'Landscape'}
-    shooting_mode_tag = tags.get('EXIF ShootingMode')
-    if shooting_mode_tag:
-        return shooting_modes.get(shooting_mode_tag.values[0], 'Unknown')
-    else:
-        return 'N/A'
-
-def _get_noise_reduction(tags):
-    noise_reduction_tag = tags.get('EXIF NoiseReduction')
-    if noise_reduction_tag:
-        return 'On' if noise_reduction_tag.values[0] == 1 else 'Off'
-    else:
-        return 'N/A'
-
-def _get_subject_area(tags):
-    subject_area_tag = tags.get('EXIF SubjectArea')
-    if subject_area_tag:
-        return f"{subject_area_tag.values}"
-    else:
-        return 'N/A'
-
-def print_clean_image_info(info):
+    }, 'Unknown')
+}
+
+def extract_clean_image_info(file_path: str, fill_missing: bool = True) -> ImageInfo:
+    # Results are cached per file version, so repeat queries for an unchanged
+    # file skip parsing; a missing file raises FileNotFoundError from stat()
+    stat = os.stat(file_path)
+    info = _extract_cached(file_path, stat.st_ino, stat.st_mtime_ns, stat.st_size, fill_missing)
+    # Copy the sections so callers can't modify the cached result
+    return info.copy()
+
+@lru_cache(maxsize=4096)
+def _extract_cached(file_path: str, inode: int, mtime_ns: int, file_size: int,
+                    fill_missing: bool) -> ImageInfo:
+    # Open the file once and share the handle between Pillow and exifread
+    with open(file_path, 'rb') as img_file:
+        # Image.open only parses the header here, which is all we read from it
+        img = Image.open(img_file)
+        properties = ImageProps(
+            format=img.format,
+            size=f"{img.size[0]} x {img.size[1]} pixels",
+            color_mode=img.mode,
+            file_size=file_size
+        )
+        for name, key in _IMAGE_INFO_FIELDS:
+            if key in img.info:
+                setattr(properties, name, img.info[key])
+            elif fill_missing:
+                setattr(properties, name, _NA)
+        
+        # Pillow has already read the EXIF block out of JPEG, PNG and WebP
+        # headers, so hand exifread that TIFF block rather than the whole file.
+        # details=False skips MakerNote decoding; none of the fields below need it
+        exif_data = img.info.get('exif')
+        if exif_data:
+            if exif_data.startswith(b'Exif\x00\x00'):
+                exif_data = exif_data[6:]
+            exif_data = _without_thumbnail_ifd(exif_data)
+            tags = exifread.process_file(io.BytesIO(exif_data), details=False)
+        elif img.format in _FILE_EXIF_FORMATS:
+            # TIFF-based files (including most camera raws) keep their IFDs in
+            # the file itself, so let exifread read them from the open file
+            img_file.seek(0)
+            tags = exifread.process_file(img_file, details=False)
+        else:
+            # Pillow found no EXIF block while reading the header (JPEG, PNG,
+            # WebP), or the format has none (GIF, BMP, ...): skip exifread
+            tags = {}
+    
+    sections: Dict[str, Any] = {name: build(tags, fill_missing) for name, build in _SECTIONS}
+    
+    other = sections['other']
+    other.file_name = os.path.basename(file_path)
+    other.file_path = file_path
+    
+    return ImageInfo(properties=properties, **sections)
+
+def _without_thumbnail_ifd(tiff: bytes) -> bytes:
+    # Clear IFD0's next-IFD offset so exifread stops after IFD0 and never
+    # builds tags for the thumbnail IFD, none of which we report. The EXIF
+    # and GPS IFDs are reached through IFD0 pointers and are unaffected.
+    endian = '<' if tiff[:2] == b'II' else '>'
+    try:
+        ifd0 = struct.unpack_from(endian + 'L', tiff, 4)[0]
+        next_ifd = ifd0 + 2 + 12 * struct.unpack_from(endian + 'H', tiff, ifd0)[0]
+    except struct.error:
+        return tiff
+    if next_ifd + 4 > len(tiff) or tiff[next_ifd:next_ifd + 4] == b'\x00\x00\x00\x00':
+        return tiff
+    return tiff[:next_ifd] + b'\x00\x00\x00\x00' + tiff[next_ifd + 4:]
+
+def _fields(cls: Type[Any], specs: Tuple[FieldSpec, ...], tags: Tags, fill_missing: bool) -> Any:
+    # Only format tags that are present; absent ones are either skipped
+    # (sparse output) or filled with 'N/A'
+    get = tags.get
+    section: Dict[str, Any] = {}
+    for name, tag_name, fmt in specs:
+        if tag_name is None:
+            # Derived from several tags, fmt returns None when all are absent
+            value = fmt(tags)
+        else:
+            tag = get(tag_name)
+            value = None if tag is None else fmt(tag)
+        if value is not None:
+            section[name] = value
+        elif fill_missing:
+            section[name] = _NA
+    return cls(**section)
+
+# exifread's formatted value; IfdTag.__str__ just returns it
+_printable = attrgetter('printable')
+
+def _frac(tag: Any) -> str:
+    value = tag.values[0]
+    # exifread's Ratio is already reduced, so only format num/den
+    if hasattr(value, 'num'):
+        num, den = value.num, value.den
+        return f"{num}/{den}" if den != 1 else str(num)
+    return str(value)
+
+def _mm(tag: Any) -> str:
+    return f"{_frac(tag)}mm"
+
+def _enum(label: str) -> Tuple[str, Callable[[Any], str]]:
+    # Build a formatter for one of the _ENUMS tables, as a (tag name, fmt) pair
+    tag_name, table, unknown = _ENUMS[label]
+    return tag_name, lambda tag: table.get(tag.values[0], unknown)
+
+def _convert_to_degrees(value: Any) -> float:
+    # num/den are ints, so true division already yields the float
+    d, m, s = value.values[:3]
+    return d.num / d.den + (m.num / m.den) / 60.0 + (s.num / s.den) / 3600.0
+
+def _extract_gps_info(tags: Tags, fill_missing: bool) -> GPSInfo:
+    get = tags.get
+    lat = get('GPS GPSLatitude')
+    lat_ref = get('GPS GPSLatitudeRef')
+    lon = get('GPS GPSLongitude')
+    lon_ref = get('GPS GPSLongitudeRef')
+    alt = get('GPS GPSAltitude')
+    
+    gps_info = GPSInfo(_NA, _NA, _NA, _NA) if fill_missing else GPSInfo()
+    if lat and lat_ref and lon and lon_ref:
+        # Resolve each hemisphere once and apply it as a sign
+        ns = 'S' if lat_ref.values[0] == 'S' else 'N'
+        ew = 'W' if lon_ref.values[0] == 'W' else 'E'
+        latitude = _convert_to_degrees(lat) * (-1.0 if ns == 'S' else 1.0)
+        longitude = _convert_to_degrees(lon) * (-1.0 if ew == 'W' else 1.0)
+        
+        gps_info.latitude = f"{latitude:.5f}° {ns}"
+        gps_info.longitude = f"{longitude:.5f}° {ew}"
+        # Create Google Maps link
+        gps_info.google_maps_link = f"https://www.google.com/maps?q={latitude},{longitude}"
+    
+    if alt:
+        altitude = alt.values[0]
+        gps_info.altitude = f"{altitude.num / altitude.den:.2f} meters"
+    
+    return gps_info
+
+def _get_resolution(tags: Tags) -> Optional[str]:
+    x_resolution = tags.get('Image XResolution')
+    y_resolution = tags.get('Image YResolution')
+    resolution_unit = tags.get('Image ResolutionUnit')
+    if x_resolution is None and y_resolution is None and resolution_unit is None:
+        return None
+    _, table, unknown = _ENUMS['Resolution Unit']
+    x_resolution = _frac(x_resolution) if x_resolution else _NA
+    y_resolution = _frac(y_resolution) if y_resolution else _NA
+    resolution_unit = table.get(resolution_unit.values[0], unknown) if resolution_unit else _NA
+    return f"{x_resolution} x {y_resolution} {resolution_unit}"
+
+def _get_subject_area(tag: Any) -> str:
+    return f"{tag.values}"
+
+# Optional values Pillow reports in img.info: (field name, info key)
+_IMAGE_INFO_FIELDS = (
+    ('dpi', 'dpi'),
+    ('duration', 'duration')
+)
+
+# Field specs per section: (label, exifread tag name, formatter). A tag name
+# of None means the formatter reads several tags and gets the whole dict.
+_CAMERA_INFORMATION_FIELDS: Tuple[FieldSpec, ...] = (
+    ('make', 'Image Make', _printable),
+    ('model', 'Image Model', _printable),
+    ('software', 'Image Software', _printable),
+    ('lens_model', 'EXIF LensModel', _printable),
+    ('camera_serial_number', 'EXIF CameraSerialNumber', _printable),
+    ('date_of_manufacture', 'EXIF DateTimeOriginal', _printable)
+)
+
+_DATE_AND_TIME_FIELDS: Tuple[FieldSpec, ...] = (
+    ('taken', 'EXIF DateTimeOriginal', _printable),
+    ('digitized', 'EXIF DateTimeDigitized', _printable),
+    ('date_time', 'EXIF DateTime', _printable),
+    ('time_zone_offset', 'EXIF OffsetTimeOriginal', _printable)
+)
+
+_CAMERA_SETTINGS_FIELDS: Tuple[FieldSpec, ...] = (
+    ('exposure_time', 'EXIF ExposureTime', _frac),
+    ('f_number', 'EXIF FNumber', _frac),
+    ('iso_speed', 'EXIF ISOSpeedRatings', _printable),
+    ('focal_length', 'EXIF FocalLength', _mm),
+    ('focal_length_35mm', 'EXIF FocalLengthIn35mmFilm', _mm),
+    ('exposure_mode', *_enum('Exposure Mode')),
+    ('white_balance', *_enum('White Balance')),
+    ('flash', *_enum('Flash')),
+    ('metering_mode', *_enum('Metering Mode')),
+    ('exposure_program', *_enum('Exposure Program')),
+    ('brightness_value', 'EXIF BrightnessValue', _frac),
+    ('exposure_bias', 'EXIF ExposureBiasValue', _frac),
+    ('max_aperture_value', 'EXIF MaxApertureValue', _frac),
+    ('digital_zoom_ratio', 'EXIF DigitalZoomRatio', _frac),
+    ('scene_capture_type', *_enum('Scene Capture Type')),
+    ('shutter_speed_value', 'EXIF ShutterSpeedValue', _frac),
+    ('aperture_value', 'EXIF ApertureValue', _frac),
+    ('color_space', *_enum('Color Space')),
+    ('focus_mode', *_enum('Focus Mode')),
+    ('shooting_mode', *_enum('Shooting Mode')),
+    ('noise_reduction', *_enum('Noise Reduction')),
+    ('subject_area', 'EXIF SubjectArea', _get_subject_area)
+)
+
+_OTHER_DETAILS_FIELDS: Tuple[FieldSpec, ...] = (
+    ('orientation', *_enum('Orientation')),
+    ('ycbcr_positioning', *_enum('YCbCr Positioning')),
+    ('resolution', None, _get_resolution),
+    ('unique_image_id', 'EXIF ImageUniqueID', _printable),
+    ('exif_version', 'EXIF ExifVersion', _printable),
+    ('compression', 'EXIF Compression', _printable),
+    ('image_width', 'EXIF ExifImageWidth', _printable),
+    ('image_length', 'EXIF ExifImageLength', _printable),
+    ('subject_distance', 'EXIF SubjectDistance', _frac),
+    ('metering_mode', *_enum('Metering Mode'))
+)
+
+# EXIF sections of ImageInfo, each built as build(tags, fill_missing)
+_SECTIONS: Tuple[Tuple[str, Callable[[Tags, bool], Any]], ...] = (
+    ('camera', partial(_fields, CameraInfo, _CAMERA_INFORMATION_FIELDS)),
+    ('date_time', partial(_fields, DateTimeInfo, _DATE_AND_TIME_FIELDS)),
+    ('settings', partial(_fields, CameraSettings, _CAMERA_SETTINGS_FIELDS)),
+    ('gps', _extract_gps_info),
+    ('other', partial(_fields, OtherDetails, _OTHER_DETAILS_FIELDS))
+)
+
+def _extract_or_exception(file_path: str) -> Union[ImageInfo, Exception]:
+    # Module level so process pool workers can unpickle it
+    try:
+        return extract_clean_image_info(file_path)
+    except Exception as e:
+        return e
+
+@overload
+def extract_many(paths: Iterable[str], use_threads: bool = ..., max_workers: Optional[int] = ...,
+                 return_exceptions: Literal[False] = ...) -> Dict[str, ImageInfo]: ...
+@overload
+def extract_many(paths: Iterable[str], use_threads: bool = ..., max_workers: Optional[int] = ...,
+                 *, return_exceptions: bool) -> Dict[str, Union[ImageInfo, Exception]]: ...
+def extract_many(paths: Iterable[str], use_threads: bool = False, max_workers: Optional[int] = None,
+                 return_exceptions: bool = False) -> Dict[str, Any]:
+    """Extract info for many files in parallel, keyed by path.
+
+    Processes are used by default since exifread parsing holds the GIL;
+    pass use_threads=True when reads from slow or network storage dominate.
+    By default the first file that fails to open or parse raises and the
+    whole batch is lost; with return_exceptions=True that file's exception
+    is returned in place of its ImageInfo and the rest are still extracted.
+    """
+    paths = list(paths)
+    extract = _extract_or_exception if return_exceptions else extract_clean_image_info
+    if use_threads:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(paths, executor.map(extract, paths)))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # Batch paths per worker round-trip to amortize the IPC cost, but keep
+        # about four chunks per worker so small batches still use every worker
+        workers = max_workers or os.cpu_count() or 1
+        chunksize = max(1, len(paths) // (workers * 4))
+        return dict(zip(paths, executor.map(extract, paths, chunksize=chunksize)))
+
+def print_clean_image_info(info: Union[ImageInfo, Dict[str, Any]]) -> None:
+    if isinstance(info, ImageInfo):
+        info = info.to_dict()
     for category, data in info.items():
         print(f"\n{category}:")
         if isinstance(data, dict):
@@ -0,0 +1,24 @@
+import os
+
+from setuptools import setup
+
+# Set USE_MYPYC=1 to compile the module to a C extension with mypyc, which
+# must then be importable by the build; without it the plain Python module is
+# installed
+ext_modules = []
+if os.environ.get('USE_MYPYC') == '1':
+    from mypyc.build import mypycify
+    ext_modules = mypycify(['image_metadata_extractor.py'])
+
+setup(
+    name='image-metadata-extractor',
+    version='0.1.0',
+    description='Extract detailed metadata from image files',
+    url='https://github.com/brendmung/image-metadata-extractor',
+    license='MIT',
+    py_modules=['image_metadata_extractor'],
+    # requirements.txt pins the tested versions; allow any compatible release
+    install_requires=['Pillow>=8.3.2', 'ExifRead>=2.3.2,<3'],
+    python_requires='>=3.10',
+    ext_modules=ext_modules,
+)